@@ -14,7 +14,7 @@ Run the application locally:
 
 Or use Uvicorn directly (recommended for production):
 
-    $ uvicorn hng.app:app --host 0.0.0.0 --port 8000 --reload
+    $ uvicorn app:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 
 Environment Variables
 ---------------------
@@ -22,6 +22,12 @@ Environment Variables
     Database connection URL for SQLAlchemy.
 - LOG_LEVEL : str
     Optional. Logging level (e.g., INFO, DEBUG, ERROR).
+- ENV : str
+    Optional. Set to "dev" to enable auto-reload with a single worker.
+- WEB_CONCURRENCY : int
+    Optional. Number of worker processes (default: 2). Each worker opens
+    up to DB_POOL_SIZE + DB_MAX_OVERFLOW database connections, so keep
+    the product below Postgres `max_connections`.
 
 Example
 -------
@@ -32,6 +38,8 @@ Example
     >>> logger.info("HNG API started successfully.")
 """
 
+import os
+
 import uvicorn
 
 from hng import create_app
@@ -47,12 +55,18 @@ app.include_router(string_router)
 
 
 # Application Entrypoint
-if __name__ == "__app__":
+if __name__ == "__main__":
     logger.info("HNG API started successfully.")
+    dev_mode = os.getenv("ENV") == "dev"
     uvicorn.run(
-        "hng.app:app",  # better than passing the app object directly
+        "app:app",  # import string is required for reload and workers
         host="127.0.0.1",
         port=8000,
-        reload=True,  # better flag for dev than 'debug'
+        loop="uvloop",
+        http="httptools",
+        reload=dev_mode,
+        workers=1 if dev_mode else max(1, int(os.getenv("WEB_CONCURRENCY", "2"))),
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
         log_level="info",
     )
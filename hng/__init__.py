@@ -11,6 +11,8 @@ Modules
 -------
 - model.analyser : Defines ORM models and database initialization logic.
 - logger : Provides JSON-based structured logging.
+- middleware : Pure-ASGI middleware (CORS).
+- responses : JSON response class shared by all endpoints.
 - api : Contains route definitions and request handlers.
 
 Usage
@@ -34,9 +36,12 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
-from hng.model.analyser import create_db_and_tables
+from hng.logger import stop_logger
+from hng.middleware import FastCORS
+from hng.model.analyser import create_db_and_tables, get_engine
+from hng.responses import ORJSONUTCResponse
+from hng.routes.route import nlp_client
 
 
 def create_app() -> FastAPI:
@@ -79,7 +84,9 @@ def create_app() -> FastAPI:
         """
         await create_db_and_tables()
         yield
-        # Add cleanup or background shutdown tasks here if needed.
+        await nlp_client.aclose()
+        await get_engine().dispose()
+        stop_logger()
 
     app = FastAPI(
         title="HNG String Analysis API",
@@ -112,15 +119,10 @@ def create_app() -> FastAPI:
             "url": "https://opensource.org/licenses/MIT",
         },
         lifespan=lifespan,
+        default_response_class=ORJSONUTCResponse,
     )
 
-    # Configure CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Consider restricting in production
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Configure CORS middleware (allows every origin; restrict in production)
+    app.add_middleware(FastCORS)
 
     return app
@@ -30,7 +30,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from hng.model.analyser import AsyncSessionLocal
+from hng.model.analyser import get_sessionmaker
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -53,7 +53,7 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     ...     result = await session.execute("SELECT 1")
     ...     print(result.scalar())
     """
-    async with AsyncSessionLocal() as session:
+    async with get_sessionmaker()() as session:
         yield session
 
 
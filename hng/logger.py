@@ -5,6 +5,8 @@ Custom JSON-based logging configuration module.
 
 This module defines a `JsonFormatter` class for structured JSON logs and a
 `setup_logger` function to configure both console and rotating file handlers.
+Records are handed to those handlers through a queue drained by a background
+thread, so logging calls never block the event loop on console or disk I/O.
 
 The resulting logs are structured, easily parseable, and suitable for
 modern monitoring or log aggregation systems such as ELK Stack, Datadog,
@@ -25,7 +27,7 @@ Usage
 Example Output
 --------------
     {
-        "timestamp": "2025-10-23T12:10:45",
+        "timestamp": "2025-10-23T12:10:45.123456Z",
         "level": "INFO",
         "logger": "root",
         "message": "Application started.",
@@ -43,12 +45,46 @@ Functions
 setup_logger() -> logging.Logger
     Configures and returns a global logger with both console
     and rotating file handlers.
+stop_logger() -> None
+    Flushes queued records and stops the background logging thread.
 """
 
 import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import orjson
+
+# Standard LogRecord attributes excluded from the custom "extras" section
+_RESERVED_LOGRECORD_ATTRS = frozenset(
+    (
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+    )
+)
 
 
 # -------------------------------------------------------------------------
@@ -73,7 +109,7 @@ class JsonFormatter(logging.Formatter):
     ...    "app", logging.INFO, __file__, 42, "Hello", None, None
     ...    )
     >>> print(formatter.format(record))
-    {"timestamp": "2025-10-23T12:15:30", "level": "INFO", ...}
+    {"timestamp":"2025-10-23T12:15:30.000000Z","level":"INFO",...}
     """
 
     def format(self, record: logging.LogRecord) -> str:
@@ -91,13 +127,14 @@ class JsonFormatter(logging.Formatter):
             JSON-encoded log information containing timestamp, level, message,
             logger name, and optional exception details.
         """
+        attrs = record.__dict__
         log_record = {
-            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
-            "level": record.levelname,
-            "logger": record.name,
+            "timestamp": datetime.fromtimestamp(attrs["created"], tz=UTC),
+            "level": attrs["levelname"],
+            "logger": attrs["name"],
             "message": record.getMessage(),
-            "pathname": record.pathname,
-            "lineno": record.lineno,
+            "pathname": attrs["pathname"],
+            "lineno": attrs["lineno"],
         }
 
         # Include exception information if available
@@ -105,33 +142,60 @@ class JsonFormatter(logging.Formatter):
             log_record["exception"] = self.formatException(record.exc_info)
 
         # Add any custom attributes attached to the record
-        for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "message",
-            ):
+        for key, value in attrs.items():
+            if key not in _RESERVED_LOGRECORD_ATTRS:
                 log_record[key] = value
 
-        return json.dumps(log_record)
+        try:
+            return orjson.dumps(
+                log_record,
+                default=str,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # orjson rejects some values stdlib json accepts (e.g. integers
+            # wider than 64 bits); never drop the record because of an extra.
+            # skipkeys drops dict keys that neither encoder can represent.
+            timestamp = log_record["timestamp"].isoformat()
+            log_record["timestamp"] = timestamp.replace("+00:00", "Z")
+            return json.dumps(
+                log_record, default=str, skipkeys=True, separators=(",", ":")
+            )
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    Queue handler for an in-process queue.
+
+    The stock `QueueHandler.prepare` pre-formats records (folding any
+    traceback into the message) so they can be pickled. Our queue never
+    leaves the process, so only the message arguments are merged here and
+    `exc_info` is kept for `JsonFormatter`.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments so the record is safe to defer.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            The log record to enqueue.
+
+        Returns
+        -------
+        logging.LogRecord
+            The record with `msg` resolved and `args` cleared.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background thread writing queued records, and the root handler feeding
+# it; both set by `setup_logger` and cleared by `stop_logger`.
+_listener: QueueListener | None = None
+_queue_handler: _LocalQueueHandler | None = None
 
 
 # -------------------------------------------------------------------------
@@ -149,6 +213,10 @@ def setup_logger() -> logging.Logger:
       - **Rotating file** (`logs/app.log`) with up to 5 backup files,
         each capped at 500 KB.
 
+    Both handlers run behind a `QueueListener` thread; the root logger
+    itself only enqueues records. Calling this function again returns the
+    already configured logger.
+
     Returns
     -------
     logging.Logger
@@ -160,16 +228,19 @@ def setup_logger() -> logging.Logger:
     >>> logger.info("Server started successfully.")
     >>> logger.warning("Memory usage high.")
     """
-    os.makedirs("logs", exist_ok=True)
+    global _listener, _queue_handler
 
     logger = logging.getLogger()
+    if _listener is not None:
+        return logger
+
+    os.makedirs("logs", exist_ok=True)
     logger.setLevel(logging.INFO)
     json_formatter = JsonFormatter()
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(json_formatter)
-    logger.addHandler(console_handler)
 
     # Rotating file handler
     rotating_handler = RotatingFileHandler(
@@ -178,6 +249,35 @@ def setup_logger() -> logging.Logger:
         backupCount=5,
     )
     rotating_handler.setFormatter(json_formatter)
-    logger.addHandler(rotating_handler)
+
+    # Queue handler: request code only enqueues, the listener does the I/O
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    _queue_handler = _LocalQueueHandler(log_queue)
+    logger.addHandler(_queue_handler)
+    _listener = QueueListener(
+        log_queue, console_handler, rotating_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
+
+
+def stop_logger() -> None:
+    """
+    Stop the background logging thread started by `setup_logger`.
+
+    Detaches the queue handler from the root logger, then blocks until
+    every queued record has been written and closes the output handlers.
+    Safe to call when the logger was never set up; `setup_logger` can be
+    called again afterwards.
+    """
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
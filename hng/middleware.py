@@ -0,0 +1,110 @@
+"""
+middleware.py.
+
+Lightweight pure-ASGI middleware used by the HNG FastAPI application.
+
+The CORS policy of this API is static (every origin, method and header is
+allowed, with credentials), so the response headers can be built once at
+import time. `FastCORS` stamps them directly onto the ASGI
+`http.response.start` message instead of constructing Starlette
+`Request`/`Response` objects for every call.
+
+Classes
+-------
+FastCORS
+    Pure-ASGI middleware applying a permissive, credentialed CORS policy.
+
+Example
+-------
+    >>> from fastapi import FastAPI
+    >>> from hng.middleware import FastCORS
+    >>> app = FastAPI()
+    >>> app.add_middleware(FastCORS)
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Precomputed CORS response headers
+_ALLOW_ORIGIN = b"access-control-allow-origin"
+_SIMPLE_HEADERS = (
+    (b"access-control-allow-credentials", b"true"),
+    (b"vary", b"Origin"),
+)
+_PREFLIGHT_HEADERS = (
+    *_SIMPLE_HEADERS,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+)
+
+
+class FastCORS:
+    """
+    Pure-ASGI CORS middleware for a permissive, credentialed policy.
+
+    Requests without an ``Origin`` header are passed through untouched.
+    Preflight requests are answered directly with ``204 No Content``; all
+    other cross-origin responses get the CORS headers appended. Because
+    credentials are allowed, the request origin is echoed back rather
+    than sending the ``*`` wildcard, which browsers reject in that case.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The downstream ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle an ASGI call, applying CORS headers to HTTP responses.
+
+        Parameters
+        ----------
+        scope : Scope
+            The ASGI connection scope.
+        receive : Receive
+            The ASGI receive channel.
+        send : Send
+            The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Preflight request: answer without reaching the application
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(_ALLOW_ORIGIN, origin), *_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send(
+                {"type": "http.response.start", "status": 204, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.append((_ALLOW_ORIGIN, origin))
+                headers.extend(_SIMPLE_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -0,0 +1,52 @@
+"""
+responses.py.
+
+Response classes used by the HNG FastAPI application.
+
+Classes
+-------
+ORJSONUTCResponse
+    `ORJSONResponse` that writes UTC datetimes with a ``Z`` suffix.
+
+Example
+-------
+    >>> from hng.responses import ORJSONUTCResponse
+    >>> ORJSONUTCResponse({"count": 0}).body
+    b'{"count":0}'
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class ORJSONUTCResponse(ORJSONResponse):
+    """
+    `ORJSONResponse` that writes UTC datetimes with a ``Z`` suffix.
+
+    Plain orjson renders UTC timestamps as ``+00:00``, while Pydantic
+    (used for the single-record endpoints) renders them as ``Z``. Passing
+    `OPT_UTC_Z` keeps every endpoint on the same wire format.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """
+        Serialize the response content to JSON bytes.
+
+        Parameters
+        ----------
+        content : Any
+            The response payload.
+
+        Returns
+        -------
+        bytes
+            The JSON-encoded payload.
+        """
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_UTC_Z,
+        )
@@ -17,6 +17,8 @@ GET /strings/{string_value}
     Retrieve the analysis details for a specific string.
 GET /strings/
     Fetch multiple analyzed strings filtered by optional query parameters.
+GET /strings/filter-by-natural-language
+    Fetch analyzed strings using filters parsed from a plain English query.
 
 Raises
 ------
@@ -30,7 +32,7 @@ Dependencies
 ------------
 - `sessionDep` (AsyncSession): Injected dependency for database interaction.
 - `Analyser` (SQLAlchemy Model): ORM model representing analyzed strings.
-- `create_properties`: Utility function that computes string analysis properties.
+- `create_properties_async`: Computes string analysis properties off the event loop.
 - `get_sha256`: Utility to generate unique hash identifiers for strings.
 
 Author
@@ -42,33 +44,190 @@ import logging
 from datetime import UTC, datetime
 from typing import Annotated, Any
 
+from cachetools import TTLCache
 from fastapi import APIRouter, Body, HTTPException, Path, Query, status
-from sqlalchemy import select
-from sqlmodel import and_
+from pydantic import ValidationError
+from sqlalchemy import (
+    DateTime,
+    StatementLambdaElement,
+    String,
+    Text,
+    lambda_stmt,
+    select,
+    tuple_,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import insert
 import httpx
-import json
+import orjson
 
 from hng.dependencies import sessionDep
 from hng.model.analyser import Analyser
-from hng.schema.get_request import GetRequest
-from hng.schema.list_response import ListResponse
-from hng.schema.properties_model import PropertiesModel
-from hng.schema.string_response import StringResponse
-from hng.utils import create_properties, get_sha256
+from hng.responses import ORJSONUTCResponse
+from hng.schema.models import (
+    GetRequest,
+    ListResponse,
+    NLFilters,
+    PropertiesModel,
+    StringResponse,
+)
+from hng.utils import create_properties_async, get_sha256, get_sha256_async
 
 NLP_API_URL = "https://nlp-funproj-string-analyser.onrender.com"
 logger = logging.getLogger(__name__)
 
+# Shared client so connections (and TLS sessions) to the NLP API are reused.
+# Closed by the application lifespan on shutdown.
+nlp_client = httpx.AsyncClient(
+    base_url=NLP_API_URL,
+    http2=True,
+    timeout=httpx.Timeout(5.0, connect=2.0),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
 string_router = APIRouter(
     prefix="/strings",
     tags=["strings"],
 )
 
+# Hashes recently seen as stored; lets duplicate floods skip the database.
+# Advisory only (per process): misses still go through the unique insert.
+_recent_hashes: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=60)
+
 # Default Error Messages
 DOES_NOT_EXIST = "value does not exist"
 DUPLICATE_VALUE = "String already exists in the system"
 NOT_STRING = '"value" must be a string'
 EMPTY_STRING = '"value" field is required'
+EMPTY_CHARACTER = '"contains_character" must not be blank'
+
+
+def _build_statement(
+    filters: dict[str, Any],
+) -> tuple[StatementLambdaElement, dict[str, Any]]:
+    """
+    Build a cached `SELECT` on the `Analyser` model from filter values.
+
+    Shared by the query-parameter and natural-language list endpoints.
+    Filters whose value is None are skipped; only the first non-blank
+    character of `contains_character` is matched. Each filter is appended
+    as a lambda so SQLAlchemy compiles one statement per combination of
+    filters and binds the filter values as parameters on later calls.
+
+    Parameters
+    ----------
+    filters : dict[str, Any]
+        Mapping of filter names (`is_palindrome`, `min_length`,
+        `max_length`, `word_count`, `contains_character`) to values.
+
+    Returns
+    -------
+    tuple[StatementLambdaElement, dict[str, Any]]
+        The lambda statement, and the filters applied.
+
+    Raises
+    ------
+    HTTPException
+        - 422: If `contains_character` is blank.
+    """
+    params = {}
+    statement = lambda_stmt(lambda: select(Analyser))
+
+    is_palindrome = filters.get("is_palindrome")
+    min_length = filters.get("min_length")
+    max_length = filters.get("max_length")
+    word_count = filters.get("word_count")
+    contains_character = filters.get("contains_character")
+
+    if is_palindrome is not None:
+        statement += lambda s: s.where(Analyser.is_palindrome == is_palindrome)
+        params["is_palindrome"] = is_palindrome
+    if min_length is not None:
+        statement += lambda s: s.where(Analyser.length >= min_length)
+        params["min_length"] = min_length
+    if max_length is not None:
+        statement += lambda s: s.where(Analyser.length <= max_length)
+        params["max_length"] = max_length
+    if word_count is not None:
+        statement += lambda s: s.where(Analyser.word_count == word_count)
+        params["word_count"] = word_count
+    if contains_character is not None:
+        # Stored keys are single lowercase characters; match them exactly
+        char = contains_character.strip()[:1].lower()
+        if not char:
+            raise HTTPException(status_code=422, detail=EMPTY_CHARACTER)
+        # Inside a lambda the closure value is bound with the column's JSONB
+        # type (jsonb ? jsonb does not exist); the ? operator takes text.
+        statement += lambda s: s.where(
+            Analyser.character_frequency_map.has_key(type_coerce(char, Text))
+        )
+        params["contains_character"] = char
+
+    return statement, params
+
+
+def _to_string_response(row: Analyser) -> StringResponse:
+    """
+    Build a `StringResponse` from a stored `Analyser` row.
+
+    The row comes from our own schema, so the models are built with
+    `model_construct` and skip Pydantic validation.
+
+    Parameters
+    ----------
+    row : Analyser
+        The database record to convert.
+
+    Returns
+    -------
+    StringResponse
+        The response model for the record.
+    """
+    return StringResponse.model_construct(
+        id=row.id,
+        value=row.value,
+        properties=PropertiesModel.model_construct(
+            length=row.length,
+            is_palindrome=row.is_palindrome,
+            unique_characters=row.unique_characters,
+            word_count=row.word_count,
+            sha256_hash=row.sha256_hash,
+            character_frequency_map=row.character_frequency_map,
+        ),
+        created_at=row.created_at,
+    )
+
+
+def _row_to_dict(row: Analyser) -> dict[str, Any]:
+    """
+    Serialize a stored `Analyser` row to the `StringResponse` JSON shape.
+
+    Used by the list endpoints, which hand plain dicts straight to
+    `ORJSONUTCResponse` instead of building one model per row.
+
+    Parameters
+    ----------
+    row : Analyser
+        The database record to convert.
+
+    Returns
+    -------
+    dict[str, Any]
+        The record as a JSON-ready dictionary.
+    """
+    return {
+        "id": row.id,
+        "value": row.value,
+        "properties": {
+            "length": row.length,
+            "is_palindrome": row.is_palindrome,
+            "unique_characters": row.unique_characters,
+            "word_count": row.word_count,
+            "sha256_hash": row.sha256_hash,
+            "character_frequency_map": row.character_frequency_map,
+        },
+        "created_at": row.created_at,
+    }
 
 
 @string_router.post(
@@ -106,37 +265,135 @@ async def create_string(req: Annotated[GetRequest, Body()], session: sessionDep)
         raise HTTPException(status_code=422, detail=NOT_STRING)
 
     value = req.value.strip()
-    prop = create_properties(value.lower())
-
-    # Prevent duplicate entries based on hash or raw value
-    if await session.get(Analyser, prop.get("sha256_hash")):
+    sha256_hash = await get_sha256_async(value)
+    if sha256_hash in _recent_hashes:
         raise HTTPException(status_code=409, detail=DUPLICATE_VALUE)
-    statement = select(Analyser).where(Analyser.value == req.value)
-    data = await session.execute(statement)
-    data_row = data.scalars().first()
-    if data_row:
+    prop = await create_properties_async(value, sha256_hash=sha256_hash)
+    created_at = datetime.now(UTC)
+
+    # Insert in a single round trip; conflicts on the hash-derived id (or
+    # the unique value) are reported by an empty RETURNING clause.
+    statement = (
+        insert(Analyser)
+        .values(
+            id=sha256_hash,
+            sha256_hash=sha256_hash,
+            value=value,
+            length=prop["length"],
+            word_count=prop["word_count"],
+            is_palindrome=prop["is_palindrome"],
+            unique_characters=prop["unique_characters"],
+            character_frequency_map=prop["character_frequency_map"],
+            created_at=created_at,
+        )
+        .on_conflict_do_nothing()
+        .returning(Analyser.id)
+    )
+    inserted_id = (await session.execute(statement)).scalar_one_or_none()
+    if inserted_id is None:
+        _recent_hashes[sha256_hash] = True
         raise HTTPException(status_code=409, detail=DUPLICATE_VALUE)
+    await session.commit()
+    _recent_hashes[sha256_hash] = True
 
-    db = Analyser(
-        id=prop.get("sha256_hash"),
-        sha256_hash=prop.get("sha256_hash"),
+    # Everything in the response was computed here; no refresh round trip
+    return StringResponse.model_construct(
+        id=inserted_id,
         value=value,
-        length=prop.get("length"),
-        word_count=prop.get("word_count"),
-        is_palindrome=prop.get("is_palindrome"),
-        unique_characters=prop.get("unique_characters"),
-        character_frequency_map=prop.get("character_frequency_map"),
-        created_at=datetime.now(UTC),
+        properties=PropertiesModel.model_construct(**prop),
+        created_at=created_at,
     )
-    session.add(db)
-    await session.commit()
-    await session.refresh(db)
 
-    return StringResponse(
-        id=db.id,
-        value=db.value,
-        properties=PropertiesModel(**prop),
-        created_at=db.created_at,
+
+@string_router.get("/filter-by-natural-language", status_code=status.HTTP_200_OK)
+async def filter_by_natural_language(
+    session: sessionDep,
+    query: str = Query(..., description="Natural language query to parse filters from"),
+):
+    """
+    Parse a natural language query into structured filters using the remote NLP API,
+    then retrieve matching strings from the database.
+
+    Example:
+    --------
+    GET /strings/filter-by-natural-language?query=strings%20longer%20than%2010%20characters
+
+    Returns:
+    --------
+    {
+        "data": [...],
+        "count": 5,
+        "interpreted_query": {
+            "original": "strings longer than 10 characters",
+            "parsed_filters": {"min_length": 11}
+        }
+    }
+    """
+    try:
+        response = await nlp_client.get("", params={"query": query})
+    except httpx.RequestError as exc:
+        logger.warning("Failed to reach NLP API: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Failed to reach NLP API: {exc}",
+        )
+
+    if response.status_code >= 400:
+        logger.warning("NLP API returned status %d", response.status_code)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"NLP API returned error: {response.status_code}",
+        )
+    logger.info("Successfully retrieved filters from NLP API.")
+
+    try:
+        parsed_filters = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Invalid JSON returned from NLP API",
+        )
+    try:
+        filters = NLFilters.model_validate(parsed_filters)
+    except ValidationError:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Invalid JSON returned from NLP API",
+        ) from None
+
+    if not parsed_filters:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unable to parse natural language query",
+        )
+
+    # Apply parsed filters to the database query
+    statement, params = _build_statement(filters.model_dump())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "NLP query %r parsed to %s; applying %s", query, parsed_filters, params
+        )
+
+    if not params:
+        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
+
+    data = await session.execute(statement)
+    result = data.scalars().all()
+
+    if not result:
+        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
+
+    data = [_row_to_dict(r) for r in result]
+
+    return ORJSONUTCResponse(
+        {
+            "data": data,
+            "count": len(data),
+            "interpreted_query": {
+                "original": query,
+                "parsed_filters": parsed_filters,
+            },
+        }
     )
 
 
@@ -167,19 +424,12 @@ async def get_string(session: sessionDep, string_value: Annotated[str, Path()]):
     value = string_value.strip()
     id = get_sha256(value.lower())
 
-    statement = select(Analyser).where(Analyser.id == id)
-    data = await session.execute(statement)
-    result = data.scalars().first()
+    result = await session.get(Analyser, id)
 
     if not result:
         raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
 
-    return {
-        "properties": PropertiesModel(**result.__dict__),
-        "id": result.id,
-        "value": result.value,
-        "created_at": result.created_at,
-    }
+    return _to_string_response(result)
 
 
 @string_router.get("/", response_model=ListResponse, status_code=status.HTTP_200_OK)
@@ -190,10 +440,18 @@ async def get_all_strings(
     max_length: Annotated[int | None, Query()] = None,
     word_count: Annotated[int | None, Query()] = None,
     contains_character: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+    after_created_at: Annotated[datetime | None, Query()] = None,
+    after_id: Annotated[str | None, Query()] = None,
 ):
     """
     Retrieve all analyzed strings matching optional filters.
 
+    Results are ordered newest first and returned one page at a time.
+    For deep paging, pass the `created_at` and `id` of the last record
+    received as `after_created_at` / `after_id` instead of a large offset.
+
     Query Parameters
     ----------------
     is_palindrome : bool, optional
@@ -205,7 +463,16 @@ async def get_all_strings(
     word_count : int, optional
         Filter by word count.
     contains_character : str, optional
-        Filter strings that include the specified character.
+        Filter strings that include the specified character (only the
+        first non-blank character is used).
+    limit : int, optional
+        Maximum number of records to return (1-200, default 50).
+    offset : int, optional
+        Number of matching records to skip (default 0).
+    after_created_at : datetime, optional
+        Keyset cursor: creation timestamp of the last record received.
+    after_id : str, optional
+        Keyset cursor: id of the last record received.
 
     Returns
     -------
@@ -222,157 +489,48 @@ async def get_all_strings(
         raise HTTPException(
             status_code=422, detail="Max length must be greater than Min length"
         )
-
-    params = {}
-    condition = []
-
-    if is_palindrome is not None:
-        condition.append(Analyser.is_palindrome == is_palindrome)
-        params["is_palindrome"] = is_palindrome
-    if min_length is not None:
-        condition.append(Analyser.length >= min_length)
-        params["min_length"] = min_length
-    if max_length is not None:
-        condition.append(Analyser.length <= max_length)
-        params["max_length"] = max_length
-    if word_count is not None:
-        condition.append(Analyser.word_count == word_count)
-        params["word_count"] = word_count
-    if contains_character:
-        char = contains_character.strip().lower()
-        condition.append(Analyser.character_frequency_map.has_key(char))
-        params["contains_character"] = contains_character
-
-    if not condition:
-        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
-
-    statement = select(Analyser).where(and_(*condition))
-    data = await session.execute(statement)
-    result = data.scalars().all()
-
-    if not result:
-        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
-
-    data = [
-        StringResponse(
-            id=r.id,
-            value=r.value,
-            properties=PropertiesModel(**r.__dict__),
-            created_at=r.created_at,
+    if (after_created_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=422,
+            detail="after_created_at and after_id must be provided together",
         )
-        for r in result
-    ]
-
-    return ListResponse(data=data, count=len(data), filters_applied=params)
-
-
-@string_router.get("/filter-by-natural-language", status_code=status.HTTP_200_OK)
-async def filter_by_natural_language(
-    session: sessionDep,
-    query: str = Query(..., description="Natural language query to parse filters from"),
-):
-    """
-    Parse a natural language query into structured filters using the remote NLP API,
-    then retrieve matching strings from the database.
 
-    Example:
-    --------
-    GET /strings/filter-by-natural-language?query=strings%20longer%20than%2010%20characters
-
-    Returns:
-    --------
-    {
-        "data": [...],
-        "count": 5,
-        "interpreted_query": {
-            "original": "strings longer than 10 characters",
-            "parsed_filters": {"min_length": 11}
+    statement, params = _build_statement(
+        {
+            "is_palindrome": is_palindrome,
+            "min_length": min_length,
+            "max_length": max_length,
+            "word_count": word_count,
+            "contains_character": contains_character,
         }
-    }
-    """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(NLP_API_URL, params={"query": query})
-            response.raise_for_status()
-            logger.info("Successfully retrieved filters from NLP API.")
-        except httpx.RequestError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail=f"Failed to reach NLP API: {exc}",
-            )
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"NLP API returned error: {exc.response.text}",
-            )
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Listing strings: params=%s", params)
 
-    try:
-        parsed_filters = response.json()
-    except json.JSONDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail="Invalid JSON returned from NLP API",
-        )
+    if not params:
+        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
 
-    if not parsed_filters:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Unable to parse natural language query",
+    if after_created_at is not None:
+        statement += lambda s: s.where(
+            tuple_(Analyser.created_at, Analyser.id)
+            < tuple_(
+                type_coerce(after_created_at, DateTime(timezone=True)),
+                type_coerce(after_id, String),
+            )
         )
-    return await parsed_filters
-
-    # Apply parsed filters to the database query
-    params = {}
-    condition = []
-
-    is_palindrome = parsed_filters.get("is_palindrome")
-    min_length = parsed_filters.get("min_length")
-    max_length = parsed_filters.get("max_length")
-    word_count = parsed_filters.get("word_count")
-    contains_character = parsed_filters.get("contains_character")
-
-    if is_palindrome is not None:
-        condition.append(Analyser.is_palindrome == is_palindrome)
-        params["is_palindrome"] = is_palindrome
-    if min_length is not None:
-        condition.append(Analyser.length >= min_length)
-        params["min_length"] = min_length
-    if max_length is not None:
-        condition.append(Analyser.length <= max_length)
-        params["max_length"] = max_length
-    if word_count is not None:
-        condition.append(Analyser.word_count == word_count)
-        params["word_count"] = word_count
-    if contains_character:
-        char = contains_character.strip().lower()
-        condition.append(Analyser.character_frequency_map.has_key(char))
-        params["contains_character"] = contains_character
+    statement += lambda s: (
+        s.order_by(Analyser.created_at.desc(), Analyser.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
 
-    if not condition:
-        raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
+    data = []
+    async for r in await session.stream_scalars(statement):
+        data.append(_row_to_dict(r))
 
-    statement = select(Analyser).where(and_(*condition))
-    data = await session.execute(statement)
-    result = data.scalars().all()
-
-    if not result:
+    if not data:
         raise HTTPException(status_code=404, detail=DOES_NOT_EXIST)
 
-    data = [
-        StringResponse(
-            id=r.id,
-            value=r.value,
-            properties=PropertiesModel(**r.__dict__),
-            created_at=r.created_at,
-        )
-        for r in result
-    ]
-
-    return {
-        "data": data,
-        "count": len(data),
-        "interpreted_query": {
-            "original": query,
-            "parsed_filters": parsed_filters,
-        },
-    }
+    return ORJSONUTCResponse(
+        {"data": data, "count": len(data), "filters_applied": params}
+    )
@@ -0,0 +1,191 @@
+"""
+models.py.
+
+Pydantic schemas for the string analysis API.
+
+This module gathers every request and response model used by the API
+in one place, so the route layer imports a single module instead of a
+chain of schema files that import each other. The per-model modules
+(`get_request`, `properties_model`, `string_response`, `list_response`
+and `nlp_parser`) re-export these classes for backward compatibility.
+
+Classes
+-------
+GetRequest
+    Schema for a simple query input containing an optional string value.
+PropertiesModel
+    Schema representing computed properties of a string.
+StringResponse
+    Schema representing the full analyzed string response.
+ListResponse
+    Schema representing a collection of analyzed string responses.
+NLParser
+    Schema representing the result of a natural language filter query.
+NLFilters
+    Schema validating the filters returned by the NLP API.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class GetRequest(BaseModel):
+    """
+    Schema for handling GET request query parameters.
+
+    Attributes
+    ----------
+    value : Optional[str]
+        The input string value to be analyzed or filtered.
+        Defaults to None if not provided.
+    """
+
+    value: Any = Field(..., description="String to analyze")
+
+
+class PropertiesModel(BaseModel):
+    """
+    Schema representing computed string analysis properties.
+
+    This model is used for both database responses and API outputs
+    when returning analyzed string results.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    length: int = Field(..., description="Total number of characters in the string.")
+    is_palindrome: bool = Field(..., description="True if the string is a palindrome.")
+    unique_characters: int = Field(
+        ..., description="Count of distinct characters, whitespace included."
+    )
+    word_count: int = Field(..., description="Number of words in the string.")
+    sha256_hash: str = Field(..., description="SHA-256 hash of the lowercase string.")
+    character_frequency_map: dict[str, int] = Field(
+        ..., description="Mapping of each non-whitespace character to its count."
+    )
+
+
+class StringResponse(BaseModel):
+    """
+    Schema representing the full response for a stored string analysis.
+
+    This model combines the analyzed string, its computed properties,
+    and metadata such as creation timestamp.
+
+    Attributes
+    ----------
+    id : str
+        The unique identifier (UUID or SHA-256 hash) of the analyzed string.
+
+    value : str
+        The original input string provided for analysis.
+
+    properties : PropertiesModel
+        Nested model containing computed string properties such as
+        length, palindrome status, and character frequency map.
+
+    created_at : datetime
+        Timestamp of when the record was created in the database.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(..., description="Unique identifier of the analyzed string.")
+    value: str = Field(..., description="Original string value analyzed.")
+    properties: PropertiesModel = Field(
+        ..., description="Computed analysis properties of the string."
+    )
+    created_at: datetime = Field(..., description="Creation timestamp of the record.")
+
+
+class ListResponse(BaseModel):
+    """
+    Schema representing a list of analyzed strings with metadata.
+
+    Attributes
+    ----------
+    data : List[StringResponse]
+        A list of analyzed string objects containing string values
+        and their computed properties.
+
+    count : int
+        The total number of records returned in the current response.
+
+    filters_applied : Dict[str, Any]
+        Dictionary of filters applied during the query, useful for
+        debugging or for clients to confirm filter criteria.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    data: list[StringResponse] = Field(
+        ..., description="List of analyzed string results."
+    )
+    count: int = Field(..., description="Total number of results returned.")
+    filters_applied: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Filters applied to the query (if any).",
+    )
+
+
+class NLParser(BaseModel):
+    """
+    Schema representing results of a natural language query interpretation.
+
+    Attributes
+    ----------
+    data : List[StringResponse]
+        A list of analyzed strings that match the interpreted natural
+        language filter criteria.
+
+    count : int
+        Total number of records that matched the interpreted query.
+
+    interpreted_query : Dict[str, Any]
+        The structured form of the interpreted natural language input.
+        This may include recognized conditions, filters, or properties.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    data: list[StringResponse] = Field(
+        ..., description="List of analyzed strings matching the query."
+    )
+    count: int = Field(..., description="Total number of matches found.")
+    interpreted_query: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Structured interpretation of the natural language query.",
+    )
+
+
+class NLFilters(BaseModel):
+    """
+    Schema validating the filters returned by the NLP API.
+
+    Validation is strict, so values of the wrong JSON type (for example
+    ``"abc"`` for `min_length` or ``"yes"`` for `is_palindrome`) are
+    rejected instead of coerced. Unknown keys are ignored.
+
+    Attributes
+    ----------
+    is_palindrome : Optional[bool]
+        Filter by palindrome property.
+    min_length : Optional[int]
+        Minimum string length to include.
+    max_length : Optional[int]
+        Maximum string length to include.
+    word_count : Optional[int]
+        Filter by word count.
+    contains_character : Optional[str]
+        Filter strings that include the specified character.
+    """
+
+    model_config = ConfigDict(strict=True, frozen=True)
+
+    is_palindrome: bool | None = None
+    min_length: int | None = None
+    max_length: int | None = None
+    word_count: int | None = None
+    contains_character: str | None = None
@@ -10,14 +10,137 @@ This module provides helper functions to compute:
 - Character frequency map
 - SHA-256 hash
 
+`analyze` computes all of them in one pass over the input, and
+`create_properties` returns its results. The `*_async` variants run
+large inputs in a worker thread so async callers do not block the
+event loop.
+
 These utilities are used by the string analysis service layer
 and exposed through the API endpoints.
 """
 
 import hashlib
 import re
+from collections import Counter
 from typing import Any
 
+import numpy as np
+from anyio import to_thread
+
+# Bound once so each call skips the module attribute lookup. hashlib's
+# constructor is the OpenSSL-backed C implementation, and OpenSSL already
+# selects SHA-NI / ARMv8 SHA-2 instructions at runtime when the CPU has them.
+_sha256 = hashlib.sha256
+
+# A word is a maximal run of word characters; a greedy \w+ is already bounded
+# by non-word characters, so \b anchors would only add matching work.
+_WORD_RE = re.compile(r"\w+")
+
+# Pure-ASCII inputs at least this long are counted with numpy.bincount;
+# for shorter strings Counter beats the array round trip.
+_BINCOUNT_MIN_LENGTH = 512
+
+# Strings at least this long are hashed in slices, so only one slice's worth
+# of UTF-8 bytes is alive at a time instead of a full copy of the input.
+_STREAM_HASH_MIN_LENGTH = 64 * 1024
+_STREAM_HASH_SLICE = 16 * 1024
+
+# Inputs at least this long are analyzed off the event loop by the async
+# helpers; below it the thread hand-off costs more than the work itself.
+_OFFLOAD_MIN_LENGTH = 10_000
+
+
+def _count_characters(lowered: str) -> dict[str, int]:
+    """
+    Count every character (whitespace included) of a lowercased string.
+
+    Long ASCII strings are counted as a byte histogram with
+    `numpy.bincount`, and their keys come out in code point order; all
+    other inputs use `Counter` and keep first-appearance order.
+
+    Parameters
+    ----------
+    lowered : str
+        The already lowercased input string.
+
+    Returns
+    -------
+    Dict[str, int]
+        A mapping of each character to its count.
+    """
+    if len(lowered) >= _BINCOUNT_MIN_LENGTH and lowered.isascii():
+        buffer = np.frombuffer(lowered.encode("ascii"), dtype=np.uint8)
+        counts = np.bincount(buffer, minlength=128).tolist()
+        return {chr(code): count for code, count in enumerate(counts) if count}
+    return Counter(lowered)
+
+
+def _is_palindrome(lowered: str) -> bool:
+    """
+    Check whether an already lowercased string is a palindrome.
+
+    Compares the first half with the reversed second half, so only half
+    of the string is copied and compared, instead of reversing it whole.
+
+    Parameters
+    ----------
+    lowered : str
+        The already lowercased input string.
+
+    Returns
+    -------
+    bool
+        True if the string reads the same backward and forward.
+    """
+    half = len(lowered) // 2
+    return lowered[:half] == lowered[-1 : -half - 1 : -1]
+
+
+def _word_count(sentence: str) -> int:
+    """
+    Count the words of a string.
+
+    Word characters match regardless of case, so the input does not need
+    to be lowercased first.
+
+    Parameters
+    ----------
+    sentence : str
+        The input string, in any case.
+
+    Returns
+    -------
+    int
+        The number of words found.
+    """
+    return len(_WORD_RE.findall(sentence))
+
+
+def _sha256_hex(lowered: str) -> str:
+    """
+    Hash an already lowercased string with SHA-256.
+
+    Long inputs are encoded and fed to the hasher slice by slice; the
+    digest is identical to hashing the whole encoded string at once.
+
+    Parameters
+    ----------
+    lowered : str
+        The already lowercased input string.
+
+    Returns
+    -------
+    str
+        A 64-character hexadecimal SHA-256 hash.
+    """
+    if len(lowered) < _STREAM_HASH_MIN_LENGTH:
+        return _sha256(lowered.encode("utf-8", "surrogatepass")).hexdigest()
+    hasher = _sha256()
+    for start in range(0, len(lowered), _STREAM_HASH_SLICE):
+        chunk = lowered[start : start + _STREAM_HASH_SLICE]
+        hasher.update(chunk.encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()
+
 
 def get_word_count(sentence: str) -> int:
     """
@@ -38,8 +161,7 @@ def get_word_count(sentence: str) -> int:
     >>> get_word_count("Hello world, again!")
     3
     """
-    words = re.findall(r"\b\w+\b", sentence.lower())
-    return len(words)
+    return _word_count(sentence)
 
 
 def get_is_palindrome(sentence: str) -> bool:
@@ -63,8 +185,7 @@ def get_is_palindrome(sentence: str) -> bool:
     >>> get_is_palindrome("Madam, I'm Adam")
     True
     """
-    normalized = sentence.lower()
-    return normalized == normalized[::-1]
+    return _is_palindrome(sentence.lower())
 
 
 def get_unique_characters(sentence: str) -> int:
@@ -79,14 +200,19 @@ def get_unique_characters(sentence: str) -> int:
     Returns
     -------
     int
-        Count of distinct characters (case-insensitive).
+        Count of distinct characters (case-insensitive, whitespace
+        included).
 
     Example
     -------
     >>> get_unique_characters("Hello")
     4
     """
-    return len(set(sentence.lower()))
+    lowered = sentence.lower()
+    if len(lowered) >= _BINCOUNT_MIN_LENGTH and lowered.isascii():
+        buffer = np.frombuffer(lowered.encode("ascii"), dtype=np.uint8)
+        return int(np.count_nonzero(np.bincount(buffer)))
+    return len(set(lowered))
 
 
 def get_character_frequency_map(sentence: str) -> dict[str, int]:
@@ -101,18 +227,16 @@ def get_character_frequency_map(sentence: str) -> dict[str, int]:
     Returns
     -------
     Dict[str, int]
-        A mapping of each lowercase character to its count.
+        A mapping of each lowercase character to its count. Whitespace
+        is not counted.
 
     Example
     -------
     >>> get_character_frequency_map("aabB")
     {'a': 2, 'b': 2}
     """
-    freq: dict[str, int] = {}
-    for char in sentence.lower():
-        if char.strip():
-            freq[char] = freq.get(char, 0) + 1
-    return freq
+    counts = _count_characters(sentence.lower())
+    return {char: count for char, count in counts.items() if not char.isspace()}
 
 
 def get_sha256(sentence: str) -> str:
@@ -129,15 +253,64 @@ def get_sha256(sentence: str) -> str:
     str
         A 64-character hexadecimal SHA-256 hash.
 
+    Notes
+    -----
+    Hashing goes through OpenSSL, which uses the hardware SHA extensions
+    (SHA-NI on x86, SHA-2 instructions on ARMv8) when available. Check the
+    linked build with ``python -c "import ssl; print(ssl.OPENSSL_VERSION)"``;
+    OpenSSL 1.1.1 or newer is required for the accelerated path.
+
     Example
     -------
     >>> get_sha256("Hello")
-    '185f8db32271fe25f561a6fc938b2e264306ec304eda518007d1764826381969'
+    '2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824'
+    """
+    return _sha256_hex(sentence.lower())
+
+
+def analyze(sentence: str, sha256_hash: str | None = None) -> dict[str, Any]:
+    """
+    Compute every string analysis property in a single fused pass.
+
+    The string is lowercased and UTF-8 encoded once, and one `Counter`
+    over it yields both the unique character count and the frequency
+    map, instead of each helper re-lowering and re-scanning the input.
+    Results match the individual `get_*` helpers: `unique_characters`
+    counts whitespace while the frequency map leaves it out, so the two
+    differ by the number of distinct whitespace characters.
+
+    Parameters
+    ----------
+    sentence : str
+        The input string to analyze.
+    sha256_hash : str, optional
+        Precomputed `get_sha256(sentence)`, used instead of hashing again.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The computed properties, as documented on `create_properties`.
+
+    Example
+    -------
+    >>> analyze("Noon")["is_palindrome"]
+    True
     """
-    return hashlib.sha256(sentence.lower().encode("utf-8")).hexdigest()
+    lowered = sentence.lower()
+    counts = _count_characters(lowered)
+    return {
+        "length": len(sentence),
+        "is_palindrome": _is_palindrome(lowered),
+        "unique_characters": len(counts),
+        "word_count": _word_count(sentence),
+        "sha256_hash": sha256_hash or _sha256_hex(lowered),
+        "character_frequency_map": {
+            char: count for char, count in counts.items() if not char.isspace()
+        },
+    }
 
 
-def create_properties(sentence: str) -> dict[str, Any]:
+def create_properties(sentence: str, sha256_hash: str | None = None) -> dict[str, Any]:
     """
     Compute and return all string analysis properties.
 
@@ -145,6 +318,9 @@ def create_properties(sentence: str) -> dict[str, Any]:
     ----------
     sentence : str
         The input string to analyze.
+    sha256_hash : str, optional
+        Precomputed `get_sha256(sentence)`. Callers that already hashed
+        the input pass it here to avoid hashing it twice.
 
     Returns
     -------
@@ -171,11 +347,53 @@ def create_properties(sentence: str) -> dict[str, Any]:
         'character_frequency_map': {'l': 2, 'e': 2, 'v': 1, 'u': 1, 'p': 1}
     }
     """
-    return {
-        "length": len(sentence),
-        "is_palindrome": get_is_palindrome(sentence),
-        "unique_characters": get_unique_characters(sentence),
-        "word_count": get_word_count(sentence),
-        "sha256_hash": get_sha256(sentence),
-        "character_frequency_map": get_character_frequency_map(sentence),
-    }
+    return analyze(sentence, sha256_hash)
+
+
+async def get_sha256_async(sentence: str) -> str:
+    """
+    Generate a SHA-256 hash of the input string without blocking the loop.
+
+    Inputs of `_OFFLOAD_MIN_LENGTH` characters or more are hashed in a
+    worker thread; hashlib releases the GIL while hashing them, so other
+    requests keep running. Shorter inputs are hashed inline.
+
+    Parameters
+    ----------
+    sentence : str
+        The input string.
+
+    Returns
+    -------
+    str
+        A 64-character hexadecimal SHA-256 hash, as from `get_sha256`.
+    """
+    if len(sentence) < _OFFLOAD_MIN_LENGTH:
+        return get_sha256(sentence)
+    return await to_thread.run_sync(get_sha256, sentence)
+
+
+async def create_properties_async(
+    sentence: str, sha256_hash: str | None = None
+) -> dict[str, Any]:
+    """
+    Compute all string analysis properties without blocking the loop.
+
+    Same result as `create_properties`; inputs of `_OFFLOAD_MIN_LENGTH`
+    characters or more are analyzed in a worker thread.
+
+    Parameters
+    ----------
+    sentence : str
+        The input string to analyze.
+    sha256_hash : str, optional
+        Precomputed `get_sha256(sentence)`, used instead of hashing again.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The computed properties, as documented on `create_properties`.
+    """
+    if len(sentence) < _OFFLOAD_MIN_LENGTH:
+        return create_properties(sentence, sha256_hash)
+    return await to_thread.run_sync(create_properties, sentence, sha256_hash)